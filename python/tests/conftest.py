@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The client modules live one directory up and are not installed as a
+# package; make them importable when pytest runs from anywhere.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
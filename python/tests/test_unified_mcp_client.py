@@ -0,0 +1,315 @@
+"""Tests for the pure-logic pieces of UnifiedMCPClient.
+
+Everything here runs without a live MCP server: WebSocket setup is
+disabled and HTTP tests go against a local stub server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import unified_mcp_client
+from unified_mcp_client import (
+    UnifiedMCPClient,
+    WebSocketTimeoutError,
+    _bulk_unsupported,
+    _serialize_filter,
+)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal API stub: bulk dependency endpoints 404, the rest succeed."""
+
+    hits = None  # set per-server in the fixture
+
+    def _respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        self.hits.append((self.command, self.path))
+        if self.path.endswith("/dependencies/bulk"):
+            self._respond(404, {"success": False, "error": "Not found"})
+        else:
+            self._respond(200, {"success": True, "path": self.path})
+
+    do_GET = _handle
+    do_POST = _handle
+    do_DELETE = _handle
+    do_PATCH = _handle
+    do_PUT = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    hits = []
+    handler = type("Handler", (StubHandler,), {"hits": hits})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", hits
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub_server):
+    base_url, _ = stub_server
+    client = UnifiedMCPClient(base_url, use_websocket=False)
+    yield client
+    client.close()
+
+
+def make_client():
+    """Client that never touches the network (WebSocket and HTTP unused)."""
+    return UnifiedMCPClient("http://stub.invalid", use_websocket=False)
+
+
+# ----------------------------------------------------------------------
+# _serialize_filter
+# ----------------------------------------------------------------------
+
+
+def test_serialize_filter_is_memoized():
+    unified_mcp_client._dumps_filter.cache_clear()
+    assert _serialize_filter({"status": "pending"}) == '{"status":"pending"}'
+    assert unified_mcp_client._dumps_filter.cache_info().hits == 0
+    _serialize_filter({"status": "pending"})
+    assert unified_mcp_client._dumps_filter.cache_info().hits == 1
+
+
+def test_serialize_filter_sorts_keys():
+    assert _serialize_filter({"b": 2, "a": 1}) == _serialize_filter({"a": 1, "b": 2})
+
+
+def test_serialize_filter_unhashable_fallback():
+    assert _serialize_filter({"nested": {"a": 1}}) == '{"nested":{"a":1}}'
+    assert _serialize_filter({"ids": ["t1", "t2"]}) == '{"ids":["t1","t2"]}'
+
+
+# ----------------------------------------------------------------------
+# _single_flight
+# ----------------------------------------------------------------------
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    client = make_client()
+    try:
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"ok": True}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(client._single_flight("k", slow))
+            )
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        assert started.wait(5)
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert len(calls) == 1
+        assert results == [{"ok": True}] * 5
+    finally:
+        client.close()
+
+
+def test_single_flight_propagates_errors_and_clears_key():
+    client = make_client()
+    try:
+
+        def boom():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            client._single_flight("k", boom)
+        assert "k" not in client._inflight
+        # A failed call must not be cached: the next call runs again.
+        with pytest.raises(ValueError):
+            client._single_flight("k", boom)
+    finally:
+        client.close()
+
+
+def test_single_flight_serves_cached_result_within_ttl():
+    client = make_client()
+    try:
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"n": len(calls)}
+
+        assert client._single_flight("k", fetch) == {"n": 1}
+        assert client._single_flight("k", fetch) == {"n": 1}
+        assert len(calls) == 1
+    finally:
+        client.close()
+
+
+def test_single_flight_prunes_expired_entries_on_insert():
+    client = make_client()
+    try:
+        client.SINGLE_FLIGHT_TTL = 0.0
+        for i in range(50):
+            client._single_flight(("task", i), lambda: {})
+        # With everything instantly expired, each insert sweeps the rest.
+        assert len(client._inflight_results) == 1
+    finally:
+        client.close()
+
+
+# ----------------------------------------------------------------------
+# health() TTL cache
+# ----------------------------------------------------------------------
+
+
+def test_health_is_cached_until_forced_or_expired(client, stub_server):
+    _, hits = stub_server
+    first = client.health()
+    assert client.health() is first
+    assert len(hits) == 1
+
+    client.health(force=True)
+    assert len(hits) == 2
+
+    client._health_cache_ts -= client.HEALTH_CACHE_TTL + 1
+    client.health()
+    assert len(hits) == 3
+
+
+# ----------------------------------------------------------------------
+# Bulk dependency fallback
+# ----------------------------------------------------------------------
+
+
+def test_add_dependencies_falls_back_on_404(client, stub_server):
+    _, hits = stub_server
+    result = client.add_dependencies("t1", ["t2", "t3"])
+    assert result["success"] is True
+    assert len(result["results"]) == 2
+    assert hits[0] == ("POST", "/api/v1/tasks/t1/dependencies/bulk")
+    assert hits[1:] == [("POST", "/api/v1/tasks/t1/dependencies")] * 2
+
+
+def test_remove_dependencies_falls_back_on_404(client, stub_server):
+    _, hits = stub_server
+    result = client.remove_dependencies("t1", ["t2"])
+    assert result["success"] is True
+    assert hits[0] == ("DELETE", "/api/v1/tasks/t1/dependencies/bulk")
+    assert hits[1] == ("DELETE", "/api/v1/tasks/t1/dependencies/t2")
+
+
+def test_bulk_unsupported_classification():
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    class FakeStatusError(Exception):
+        """Shaped like requests.HTTPError / httpx.HTTPStatusError."""
+
+        def __init__(self, status_code):
+            self.response = FakeResponse(status_code)
+
+    class FakeAiohttpError(Exception):
+        """Shaped like aiohttp.ClientResponseError: a bare status attr."""
+
+        def __init__(self, status):
+            self.status = status
+
+    assert _bulk_unsupported(FakeStatusError(404))
+    assert not _bulk_unsupported(FakeStatusError(500))
+    assert _bulk_unsupported(FakeAiohttpError(404))
+    assert not _bulk_unsupported(FakeAiohttpError(500))
+    assert _bulk_unsupported(WebSocketTimeoutError("no ack"))
+    assert not _bulk_unsupported(Exception("boom"))
+
+
+def test_async_add_dependencies_falls_back_on_404(stub_server):
+    aiohttp = pytest.importorskip("aiohttp")  # noqa: F841
+    import asyncio
+
+    from unified_mcp_client_async import AsyncUnifiedMCPClient
+
+    base_url, hits = stub_server
+
+    async def run():
+        async with AsyncUnifiedMCPClient(base_url, use_websocket=False) as client:
+            return await client.add_dependencies("t1", ["t2", "t3"])
+
+    result = asyncio.run(run())
+    assert result["success"] is True
+    assert len(result["results"]) == 2
+    assert hits[0] == ("POST", "/api/v1/tasks/t1/dependencies/bulk")
+    # Fallback calls run concurrently, so only their count is deterministic.
+    assert hits.count(("POST", "/api/v1/tasks/t1/dependencies")) == 2
+
+
+def test_add_dependencies_reraises_non_404(client, stub_server, monkeypatch):
+    def explode(*args, **kwargs):
+        raise RuntimeError("server on fire")
+
+    monkeypatch.setattr(client, "_call", explode)
+    with pytest.raises(RuntimeError):
+        client.add_dependencies("t1", ["t2"])
+
+
+# ----------------------------------------------------------------------
+# WebSocket setup failure
+# ----------------------------------------------------------------------
+
+
+def test_ws_setup_failure_keeps_pool_and_falls_back_per_request(stub_server):
+    # The stub speaks plain HTTP, so every Socket.IO connect fails — like
+    # constructing a client while the server is down. The pool must stay
+    # populated (so lazy reconnect can restore WS later) while individual
+    # calls fall back to HTTP.
+    base_url, hits = stub_server
+    client = UnifiedMCPClient(base_url, use_websocket=True, ws_pool_size=2, timeout=5)
+    try:
+        assert client.sio is not None
+        assert len(client._ws_clients) == 2
+        assert client._ws_pool.qsize() == 2
+        result = client.list_tasks()
+        assert result["success"] is True
+        assert ("GET", "/api/v1/tasks") in hits
+    finally:
+        client.close()
+
+
+# ----------------------------------------------------------------------
+# close() / context manager
+# ----------------------------------------------------------------------
+
+
+def test_close_is_idempotent():
+    client = make_client()
+    client.close()
+    assert client.session is None
+    client.close()  # must not raise
+
+
+def test_context_manager_closes():
+    with make_client() as client:
+        assert client.session is not None
+    assert client.session is None
@@ -0,0 +1,573 @@
+"""Unified Python client for the Agency Swarm MCP server.
+
+Talks to the MCP server's REST API over HTTP and, when available, its
+Socket.IO channel for lower-latency request/response and server-pushed
+events (task updates, agent status). WebSocket usage is opt-out: if the
+socket connection cannot be established the client falls back to HTTP
+for every call.
+
+Usage:
+    client = UnifiedMCPClient("http://localhost:3000", api_key="...")
+    tasks = client.list_tasks(filter={"status": "pending"})
+    client.close()
+"""
+
+import atexit
+import concurrent.futures
+import functools
+import logging
+import queue
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import socketio
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketTimeoutError(Exception):
+    """Raised when a WebSocket request gets no acknowledgement in time."""
+
+
+def _bulk_unsupported(e: Exception) -> bool:
+    """True when a bulk-endpoint failure means the server lacks support.
+
+    HTTP: a 404 from any transport — requests.HTTPError and
+    httpx.HTTPStatusError carry response.status_code, while aiohttp's
+    ClientResponseError (used by the async client) carries a bare status.
+    All are duck-typed so neither httpx nor aiohttp needs to be installed.
+    WebSocket: a server without a handler for the bulk event never acks,
+    which surfaces as WebSocketTimeoutError.
+    """
+    if isinstance(e, WebSocketTimeoutError):
+        return True
+    response = getattr(e, "response", None)
+    if getattr(response, "status_code", None) == 404:
+        return True
+    return getattr(e, "status", None) == 404
+
+
+@functools.lru_cache(maxsize=128)
+def _dumps_filter(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Serialize a filter's items, memoized for repeated identical filters."""
+    return orjson.dumps(dict(items), option=orjson.OPT_SORT_KEYS).decode()
+
+
+def _serialize_filter(filter: Dict[str, Any]) -> str:
+    """Serialize a filter dict, reusing cached JSON when values are hashable.
+
+    Polling loops tend to pass the exact same filter on every call; the
+    memoized path skips re-serializing it. Unhashable values (nested
+    dicts/lists) fall back to a plain dumps.
+    """
+    try:
+        return _dumps_filter(tuple(sorted(filter.items())))
+    except TypeError:
+        return orjson.dumps(filter, option=orjson.OPT_SORT_KEYS).decode()
+
+
+class UnifiedMCPClient:
+    """Client for the Agency Swarm MCP server (HTTP + optional WebSocket)."""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        use_websocket: bool = True,
+        ws_pool_size: int = 4,
+        pool_maxsize: int = 32,
+        transport: Literal["requests", "httpx"] = "requests",
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+        # One session for the lifetime of the client so urllib3 keeps
+        # connections alive between calls instead of paying a fresh
+        # TCP + TLS handshake per request. pool_maxsize bounds how many
+        # connections per host concurrent threads can hold at once.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Optional HTTP/2 backend: one TCP connection multiplexes
+        # concurrent streams, avoiding HTTP/1.1 head-of-line blocking
+        # for burst workloads. Requires httpx[http2].
+        self.transport = transport
+        self._http = None
+        if transport == "httpx":
+            import httpx
+
+            self._http = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=pool_maxsize),
+            )
+        elif transport != "requests":
+            raise ValueError(f"Unknown transport: {transport!r}")
+
+        self._health_cache: Optional[Dict[str, Any]] = None
+        self._health_cache_ts = 0.0
+
+        self._inflight: Dict[Any, "concurrent.futures.Future"] = {}
+        self._inflight_lock = threading.Lock()
+        self._inflight_results: Dict[Any, Tuple[float, Dict[str, Any]]] = {}
+
+        self.use_websocket = use_websocket
+        self.ws_pool_size = max(1, ws_pool_size)
+        self.sio: Optional["socketio.Client"] = None
+        self._ws_pool: "queue.Queue[socketio.Client]" = queue.Queue()
+        self._ws_clients: List["socketio.Client"] = []
+        self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
+        if use_websocket:
+            self._setup_websocket()
+
+        # Clean up leaked WS threads and HTTP connections even if the
+        # caller never gets around to close().
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Issue an HTTP request against the REST API and return parsed JSON."""
+        url = f"{self.base_url}/api/v1/{endpoint.lstrip('/')}"
+        body = orjson.dumps(data) if data is not None else None
+        if self._http is not None:
+            response = self._http.request(method, url, content=body, params=params)
+        else:
+            response = self.session.request(
+                method, url, data=body, params=params, timeout=self.timeout
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _setup_websocket(self):
+        """Pre-connect a pool of Socket.IO clients.
+
+        Paying the TCP+TLS+WS handshake for all connections up front means
+        _socket_request can always borrow a live connection instead of
+        stalling 200-500 ms on a cold one. Server-pushed events are only
+        subscribed on the first client so handlers fire once per event.
+
+        A failed initial connect keeps the pooled clients around rather
+        than demoting the whole client to HTTP: _socket_request connects
+        unconnected sockets lazily, so WS comes back as soon as the server
+        does, and individual requests fall back to HTTP until then.
+
+        socketio (and the engineio/websocket-client stack behind it) is
+        imported here rather than at module top so HTTP-only users don't
+        pay its import time and memory.
+        """
+        import socketio
+
+        for i in range(self.ws_pool_size):
+            sio = socketio.Client(
+                reconnection=True,
+                reconnection_attempts=0,
+                reconnection_delay=0.5,
+                reconnection_delay_max=5,
+                randomization_factor=0.5,
+            )
+            if i == 0:
+
+                @sio.on("*")
+                def catch_all(event, *args):
+                    self._trigger_event(event, *args)
+
+            self._ws_clients.append(sio)
+            self._ws_pool.put(sio)
+        self.sio = self._ws_clients[0]
+
+        for sio in self._ws_clients:
+            try:
+                sio.connect(self.base_url, headers=self.headers, wait=True)
+                self._tune_transport_socket(sio)
+            except Exception as e:
+                logger.warning(
+                    "WebSocket connection failed, will connect lazily: %s", e
+                )
+                # The remaining sockets would fail the same way right now;
+                # leave them for _socket_request's lazy connect.
+                break
+
+    @staticmethod
+    def _tune_transport_socket(sio: "socketio.Client"):
+        """Disable Nagle and widen buffers on the engine.io transport socket.
+
+        Nagle's algorithm can delay small real-time frames (task update
+        callbacks) by up to 40 ms, and default OS buffers throttle bursts.
+        The attribute path into the underlying websocket-client socket
+        varies by engineio version, so everything is hasattr-guarded and
+        failures are ignored.
+        """
+        try:
+            ws = getattr(getattr(sio, "eio", None), "ws", None)
+            sock = getattr(ws, "sock", None)
+            if sock is None or not hasattr(sock, "setsockopt"):
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        except OSError as e:
+            logger.debug("Could not tune WebSocket transport socket: %s", e)
+
+    def _socket_request(
+        self, event: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Emit an event and wait for its acknowledgement response.
+
+        Raises ConnectionError when the borrowed socket is down and a lazy
+        reconnect fails; _call treats that as a cue to fall back to HTTP
+        for this one request rather than for the client's lifetime.
+        """
+        import socketio
+
+        sio = self._ws_pool.get()
+        try:
+            if not sio.connected:
+                # Dropped sockets are restored by the library's background
+                # reconnect task; connecting here too would race it, so
+                # only connect lazily when no such task exists (i.e. the
+                # initial connect never succeeded, e.g. the server was
+                # down at startup).
+                if getattr(sio, "_reconnect_task", None) is not None:
+                    raise ConnectionError(
+                        f"WebSocket reconnecting, unavailable for event: {event}"
+                    )
+                try:
+                    sio.connect(self.base_url, headers=self.headers, wait=True)
+                    self._tune_transport_socket(sio)
+                except socketio.exceptions.ConnectionError as e:
+                    raise ConnectionError(
+                        f"WebSocket unavailable for event: {event}"
+                    ) from e
+            response = sio.call(event, data or {}, timeout=self.timeout)
+        except socketio.exceptions.TimeoutError:
+            raise WebSocketTimeoutError(
+                f"WebSocket request timeout for event: {event}"
+            )
+        finally:
+            self._ws_pool.put(sio)
+
+        if isinstance(response, dict) and not response.get("success", True):
+            raise Exception(response.get("error", "Unknown error"))
+        return response if isinstance(response, dict) else {}
+
+    def _call(
+        self,
+        event: str,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Route a call over WebSocket when available, otherwise HTTP."""
+        if self.sio is not None:
+            payload = dict(data or {})
+            if params:
+                payload.update(params)
+            try:
+                return self._socket_request(event, payload)
+            except ConnectionError:
+                logger.warning(
+                    "WebSocket unavailable, using HTTP for event %r", event
+                )
+        return self._request(method, endpoint, data=data, params=params)
+
+    #: Seconds a completed single-flight result may be served to new callers.
+    SINGLE_FLIGHT_TTL = 0.5
+
+    def _single_flight(self, key: Any, fn: Callable[[], Dict[str, Any]]):
+        """Coalesce concurrent identical reads into one request.
+
+        The first caller for a key performs the request; callers arriving
+        while it is in flight wait on the same Future instead of firing a
+        duplicate round-trip. Completed results are also served for up to
+        SINGLE_FLIGHT_TTL seconds so immediate re-reads stay local.
+        """
+        with self._inflight_lock:
+            cached = self._inflight_results.get(key)
+            if cached is not None:
+                ts, result = cached
+                if time.monotonic() - ts < self.SINGLE_FLIGHT_TTL:
+                    return result
+                del self._inflight_results[key]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result(timeout=self.timeout)
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        with self._inflight_lock:
+            # Sweep expired entries on insert so a client fetching many
+            # distinct ids doesn't accumulate one stale result per id.
+            now = time.monotonic()
+            expired = [
+                k
+                for k, (ts, _) in self._inflight_results.items()
+                if now - ts >= self.SINGLE_FLIGHT_TTL
+            ]
+            for k in expired:
+                del self._inflight_results[k]
+            self._inflight_results[key] = (now, result)
+        future.set_result(result)
+        return result
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def on(self, event: str, handler: Callable):
+        """Register a handler for a server-pushed event (e.g. task_updated)."""
+        self.event_handlers[event].append(handler)
+
+    def _trigger_event(self, event: str, *args):
+        handlers = self.event_handlers.get(event)
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(*args)
+            except Exception:
+                logger.exception("Error in handler for event %r", event)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    #: Seconds a cached health() response stays fresh.
+    HEALTH_CACHE_TTL = 60.0
+
+    def health(self, force: bool = False) -> Dict[str, Any]:
+        """Return server health and capability information.
+
+        Results are cached for HEALTH_CACHE_TTL seconds since capabilities
+        rarely change within a run; pass force=True to bypass the cache.
+        """
+        if (
+            not force
+            and self._health_cache is not None
+            and time.monotonic() - self._health_cache_ts < self.HEALTH_CACHE_TTL
+        ):
+            return self._health_cache
+        self._health_cache = self._request("GET", "health")
+        self._health_cache_ts = time.monotonic()
+        return self._health_cache
+
+    def list_agents(self, filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List agents, optionally filtered (e.g. {"status": "idle"})."""
+        params = None
+        if filter:
+            params = {"filter": _serialize_filter(filter)}
+        return self._call("agent:list", "GET", "agents", params=params)
+
+    def get_agent(self, agent_id: str) -> Dict[str, Any]:
+        """Fetch a single agent by id.
+
+        Concurrent calls for the same id share one request; see
+        _single_flight.
+        """
+        return self._single_flight(
+            ("agent", agent_id),
+            lambda: self._call(
+                "agent:get", "GET", f"agents/{agent_id}", data={"agentId": agent_id}
+            ),
+        )
+
+    def list_tasks(self, filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """List tasks, optionally filtered (e.g. {"status": "pending"})."""
+        params = None
+        if filter:
+            params = {"filter": _serialize_filter(filter)}
+        return self._call("task:list", "GET", "tasks", params=params)
+
+    def create_task(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "medium",
+        dependencies: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Create a task and return its record."""
+        data = {
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "dependencies": dependencies or [],
+        }
+        return self._call("task:create", "POST", "tasks", data=data)
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        """Fetch a single task by id.
+
+        Concurrent calls for the same id share one request; see
+        _single_flight.
+        """
+        return self._single_flight(
+            ("task", task_id),
+            lambda: self._call(
+                "task:get", "GET", f"tasks/{task_id}", data={"taskId": task_id}
+            ),
+        )
+
+    def update_task(self, task_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a partial update to a task."""
+        data = {"taskId": task_id, "updates": updates}
+        return self._call("task:update", "PATCH", f"tasks/{task_id}", data=data)
+
+    def set_task_status(self, task_id: str, status: str) -> Dict[str, Any]:
+        """Set a task's status (pending, in-progress, done, deferred)."""
+        data = {"taskId": task_id, "status": status}
+        return self._call(
+            "task:setStatus", "PUT", f"tasks/{task_id}/status", data=data
+        )
+
+    def add_dependency(self, task_id: str, depends_on: str) -> Dict[str, Any]:
+        """Make task_id depend on another task."""
+        data = {"taskId": task_id, "dependsOnTaskId": depends_on}
+        return self._call(
+            "task:addDependency", "POST", f"tasks/{task_id}/dependencies", data=data
+        )
+
+    def remove_dependency(self, task_id: str, depends_on: str) -> Dict[str, Any]:
+        """Remove a dependency from a task."""
+        data = {"taskId": task_id, "dependsOnTaskId": depends_on}
+        return self._call(
+            "task:removeDependency",
+            "DELETE",
+            f"tasks/{task_id}/dependencies/{depends_on}",
+            data=data,
+        )
+
+    def add_dependencies(
+        self, task_id: str, depends_on_ids: List[str]
+    ) -> Dict[str, Any]:
+        """Make task_id depend on several tasks in one round-trip.
+
+        Falls back to one request per dependency (still amortized over the
+        keep-alive session) when the server lacks the bulk endpoint: an
+        HTTP 404 on either transport, or a WebSocket ack timeout for the
+        bulk event.
+        """
+        data = {"taskId": task_id, "dependsOnTaskIds": list(depends_on_ids)}
+        try:
+            return self._call(
+                "task:addDependencies",
+                "POST",
+                f"tasks/{task_id}/dependencies/bulk",
+                data=data,
+            )
+        except Exception as e:
+            if not _bulk_unsupported(e):
+                raise
+        results = [self.add_dependency(task_id, dep) for dep in depends_on_ids]
+        return {"success": True, "results": results}
+
+    def remove_dependencies(
+        self, task_id: str, depends_on_ids: List[str]
+    ) -> Dict[str, Any]:
+        """Remove several dependencies from task_id in one round-trip.
+
+        Falls back to one request per dependency when the server lacks the
+        bulk endpoint: an HTTP 404 on either transport, or a WebSocket ack
+        timeout for the bulk event.
+        """
+        data = {"taskId": task_id, "dependsOnTaskIds": list(depends_on_ids)}
+        try:
+            return self._call(
+                "task:removeDependencies",
+                "DELETE",
+                f"tasks/{task_id}/dependencies/bulk",
+                data=data,
+            )
+        except Exception as e:
+            if not _bulk_unsupported(e):
+                raise
+        results = [self.remove_dependency(task_id, dep) for dep in depends_on_ids]
+        return {"success": True, "results": results}
+
+    def next_task(self) -> Dict[str, Any]:
+        """Return the next workable task given dependencies and priority."""
+        return self._call("task:next", "GET", "tasks/next")
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Disconnect all pooled WebSockets and release HTTP connections.
+
+        Idempotent: safe to call repeatedly, from __exit__ and from the
+        atexit hook registered in __init__.
+        """
+        for sio in self._ws_clients:
+            try:
+                sio.disconnect()
+            except Exception:
+                pass
+        self._ws_clients = []
+        self._ws_pool = queue.Queue()
+        self.sio = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if getattr(self, "session", None) is not None:
+            self.session.close()
+            self.session = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "UnifiedMCPClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,321 @@
+"""Async Python client for the Agency Swarm MCP server.
+
+Mirrors the API of :class:`unified_mcp_client.UnifiedMCPClient` with
+``async def`` methods so callers can issue many calls concurrently on one
+event loop — N parallel requests cost roughly one round-trip instead of N.
+HTTP goes through a shared ``aiohttp.ClientSession``; WebSocket traffic
+uses ``socketio.AsyncClient`` with its built-in ack-based ``call()``.
+
+Usage:
+    async with AsyncUnifiedMCPClient("http://localhost:3000") as client:
+        tasks = await asyncio.gather(*(client.get_task(i) for i in ids))
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+import socketio
+
+from unified_mcp_client import WebSocketTimeoutError, _bulk_unsupported
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncUnifiedMCPClient:
+    """Async client for the Agency Swarm MCP server (HTTP + optional WebSocket)."""
+
+    #: Seconds a cached health() response stays fresh.
+    HEALTH_CACHE_TTL = 60.0
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        use_websocket: bool = True,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+        self.use_websocket = use_websocket
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.sio: Optional[socketio.AsyncClient] = None
+        self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
+
+        self._health_cache: Optional[Dict[str, Any]] = None
+        self._health_cache_ts = 0.0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def connect(self):
+        """Open the HTTP session and, if enabled, the WebSocket connection."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        if self.use_websocket and self.sio is None:
+            try:
+                self.sio = socketio.AsyncClient()
+
+                @self.sio.on("*")
+                async def catch_all(event, *args):
+                    self._trigger_event(event, *args)
+
+                await self.sio.connect(self.base_url, headers=self.headers)
+            except Exception as e:
+                logger.warning(
+                    "WebSocket connection failed, falling back to HTTP: %s", e
+                )
+                self.sio = None
+
+    async def close(self):
+        """Disconnect the WebSocket and release HTTP connections."""
+        if self.sio:
+            await self.sio.disconnect()
+            self.sio = None
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncUnifiedMCPClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Issue an HTTP request against the REST API and return parsed JSON."""
+        if self.session is None:
+            await self.connect()
+        url = f"{self.base_url}/api/v1/{endpoint.lstrip('/')}"
+        async with self.session.request(
+            method, url, json=data, params=params
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def _socket_request(
+        self, event: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Emit an event and await its acknowledgement response."""
+        try:
+            response = await self.sio.call(event, data or {}, timeout=self.timeout)
+        except socketio.exceptions.TimeoutError:
+            raise WebSocketTimeoutError(
+                f"WebSocket request timeout for event: {event}"
+            )
+        if isinstance(response, dict) and not response.get("success", True):
+            raise Exception(response.get("error", "Unknown error"))
+        return response if isinstance(response, dict) else {}
+
+    async def _call(
+        self,
+        event: str,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Route a call over WebSocket when connected, otherwise HTTP."""
+        if self.sio is not None and self.sio.connected:
+            payload = dict(data or {})
+            if params:
+                payload.update(params)
+            return await self._socket_request(event, payload)
+        return await self._request(method, endpoint, data=data, params=params)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def on(self, event: str, handler: Callable):
+        """Register a handler for a server-pushed event (e.g. task_updated)."""
+        self.event_handlers[event].append(handler)
+
+    def _trigger_event(self, event: str, *args):
+        handlers = self.event_handlers.get(event)
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(*args)
+            except Exception:
+                logger.exception("Error in handler for event %r", event)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    async def health(self, force: bool = False) -> Dict[str, Any]:
+        """Return server health and capability information.
+
+        Results are cached for HEALTH_CACHE_TTL seconds; pass force=True
+        to bypass the cache.
+        """
+        if (
+            not force
+            and self._health_cache is not None
+            and time.monotonic() - self._health_cache_ts < self.HEALTH_CACHE_TTL
+        ):
+            return self._health_cache
+        self._health_cache = await self._request("GET", "health")
+        self._health_cache_ts = time.monotonic()
+        return self._health_cache
+
+    async def list_agents(
+        self, filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """List agents, optionally filtered (e.g. {"status": "idle"})."""
+        params = None
+        if filter:
+            params = {"filter": json.dumps(filter, sort_keys=True)}
+        return await self._call("agent:list", "GET", "agents", params=params)
+
+    async def get_agent(self, agent_id: str) -> Dict[str, Any]:
+        """Fetch a single agent by id."""
+        return await self._call(
+            "agent:get", "GET", f"agents/{agent_id}", data={"agentId": agent_id}
+        )
+
+    async def list_tasks(
+        self, filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """List tasks, optionally filtered (e.g. {"status": "pending"})."""
+        params = None
+        if filter:
+            params = {"filter": json.dumps(filter, sort_keys=True)}
+        return await self._call("task:list", "GET", "tasks", params=params)
+
+    async def create_task(
+        self,
+        title: str,
+        description: str = "",
+        priority: str = "medium",
+        dependencies: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Create a task and return its record."""
+        data = {
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "dependencies": dependencies or [],
+        }
+        return await self._call("task:create", "POST", "tasks", data=data)
+
+    async def get_task(self, task_id: str) -> Dict[str, Any]:
+        """Fetch a single task by id."""
+        return await self._call(
+            "task:get", "GET", f"tasks/{task_id}", data={"taskId": task_id}
+        )
+
+    async def update_task(
+        self, task_id: str, updates: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply a partial update to a task."""
+        data = {"taskId": task_id, "updates": updates}
+        return await self._call("task:update", "PATCH", f"tasks/{task_id}", data=data)
+
+    async def set_task_status(self, task_id: str, status: str) -> Dict[str, Any]:
+        """Set a task's status (pending, in-progress, done, deferred)."""
+        data = {"taskId": task_id, "status": status}
+        return await self._call(
+            "task:setStatus", "PUT", f"tasks/{task_id}/status", data=data
+        )
+
+    async def add_dependency(self, task_id: str, depends_on: str) -> Dict[str, Any]:
+        """Make task_id depend on another task."""
+        data = {"taskId": task_id, "dependsOnTaskId": depends_on}
+        return await self._call(
+            "task:addDependency", "POST", f"tasks/{task_id}/dependencies", data=data
+        )
+
+    async def remove_dependency(self, task_id: str, depends_on: str) -> Dict[str, Any]:
+        """Remove a dependency from a task."""
+        data = {"taskId": task_id, "dependsOnTaskId": depends_on}
+        return await self._call(
+            "task:removeDependency",
+            "DELETE",
+            f"tasks/{task_id}/dependencies/{depends_on}",
+            data=data,
+        )
+
+    async def add_dependencies(
+        self, task_id: str, depends_on_ids: List[str]
+    ) -> Dict[str, Any]:
+        """Make task_id depend on several tasks in one round-trip.
+
+        Falls back to concurrent per-dependency calls when the server
+        lacks the bulk endpoint: an HTTP 404, or a WebSocket ack timeout
+        for the bulk event.
+        """
+        data = {"taskId": task_id, "dependsOnTaskIds": list(depends_on_ids)}
+        try:
+            return await self._call(
+                "task:addDependencies",
+                "POST",
+                f"tasks/{task_id}/dependencies/bulk",
+                data=data,
+            )
+        except Exception as e:
+            if not _bulk_unsupported(e):
+                raise
+        results = list(
+            await asyncio.gather(
+                *(self.add_dependency(task_id, dep) for dep in depends_on_ids)
+            )
+        )
+        return {"success": True, "results": results}
+
+    async def remove_dependencies(
+        self, task_id: str, depends_on_ids: List[str]
+    ) -> Dict[str, Any]:
+        """Remove several dependencies from task_id in one round-trip.
+
+        Falls back to concurrent per-dependency calls when the server
+        lacks the bulk endpoint: an HTTP 404, or a WebSocket ack timeout
+        for the bulk event.
+        """
+        data = {"taskId": task_id, "dependsOnTaskIds": list(depends_on_ids)}
+        try:
+            return await self._call(
+                "task:removeDependencies",
+                "DELETE",
+                f"tasks/{task_id}/dependencies/bulk",
+                data=data,
+            )
+        except Exception as e:
+            if not _bulk_unsupported(e):
+                raise
+        results = list(
+            await asyncio.gather(
+                *(self.remove_dependency(task_id, dep) for dep in depends_on_ids)
+            )
+        )
+        return {"success": True, "results": results}
+
+    async def next_task(self) -> Dict[str, Any]:
+        """Return the next workable task given dependencies and priority."""
+        return await self._call("task:next", "GET", "tasks/next")